@@ -1,31 +1,28 @@
-from sqlalchemy.ext.asyncio.session import AsyncSession
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from db.database import get_async_db
+from functools import lru_cache
 from jose import JWTError, jwt
+from time import time as _now
 import os
 
 # 1. Configuration
 SECRET_KEY = os.getenv("SECRET_KEY")
 ALGORITHM = os.getenv("ALGORITHM")
 
+# Distinct tokens whose decoded claims are kept in memory
+TOKEN_CACHE_SIZE = 4096
+
 # 2. Define the scheme
 # This tells Swagger UI where to find the token (the URL of your auth service)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="http://localhost/auth/login")
 
 
-# 3. The Dependency
-async def get_current_user_id(
-    token: str = Depends(oauth2_scheme),
-    db: AsyncSession = Depends(get_async_db),
-) -> int:
+@lru_cache(maxsize=TOKEN_CACHE_SIZE)
+def _decode(token: str) -> tuple[int, float | None]:
     """
-    Decodes the token, verifies validity, and returns the User id.
+    Verifies the token signature once and returns its (user id, expiry).
+    Only successful decodes are cached, failures raise and are retried.
     """
-    if not SECRET_KEY:
-        raise ValueError("CRITICAL: SECRET_KEY environment variable is required.")
-    if not ALGORITHM:
-        raise ValueError("CRITICAL: ALGORITHM environment variable is required.")
     try:
         payload: dict[str, str] = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
     except JWTError as e:
@@ -42,9 +39,30 @@ async def get_current_user_id(
             detail="Did not find the user id in the payload",
         )
     try:
-        return int(user_id)
+        exp = payload.get("exp")
+        return int(user_id), float(exp) if exp is not None else None
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"User ID format is invalid: {e}",
         )
+
+
+# 3. The Dependency
+async def get_current_user_id(token: str = Depends(oauth2_scheme)) -> int:
+    """
+    Decodes the token, verifies validity, and returns the User id.
+    """
+    if not SECRET_KEY:
+        raise ValueError("CRITICAL: SECRET_KEY environment variable is required.")
+    if not ALGORITHM:
+        raise ValueError("CRITICAL: ALGORITHM environment variable is required.")
+    user_id, exp = _decode(token)
+    # The cached decode does not re-check the expiry, so it is enforced here on every call
+    if exp is not None and exp <= _now():
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials: Signature has expired.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return user_id
@@ -1,4 +1,16 @@
 from contextvars import ContextVar
+from dataclasses import dataclass
 
-# This holds the ID for the duration of one request
-request_id_ctx: ContextVar[str] = ContextVar("request_id", default="n/a")
\ No newline at end of file
+
+@dataclass(frozen=True, slots=True)
+class ReqCtx:
+    id: str
+    # Head-based sampling decision, taken once per request by the middleware
+    sampled: bool = True
+
+
+# This holds the ID for the duration of one request.
+# A ContextVar lookup costs ~150 ns per log record, while walking the stack
+# (inspect / traceback.extract_stack) to find the request costs ~20 µs, so log
+# enrichment must keep reading the ID from here.
+request_ctx: ContextVar[ReqCtx] = ContextVar("request_ctx", default=ReqCtx("n/a"))
@@ -3,6 +3,7 @@ from sqlalchemy.ext.asyncio.session import AsyncSession
 from sqlalchemy.ext.asyncio.engine import AsyncEngine
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy import MetaData
+from fastapi import Request
 from dotenv import load_dotenv
 import os
 
@@ -28,31 +29,71 @@ COMMENT_DATABASE_URL: str | None = os.getenv("COMMENT_DATABASE_URL")
 if not COMMENT_DATABASE_URL:
     raise ValueError("CRITICAL: COMMENT_DATABASE_URL environment variable is required.")
 
+# Pool sizing, overridable per deployment. The defaults leave enough headroom
+# for concurrent requests instead of queueing on a handful of connections.
+DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "40"))
+DB_POOL_TIMEOUT: int = int(os.getenv("DB_POOL_TIMEOUT", "10"))
+DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+# Compiled SQL statements kept per engine (lambda statements included)
+DB_QUERY_CACHE_SIZE: int = int(os.getenv("DB_QUERY_CACHE_SIZE", "1200"))
+
 # ------------------------------------------------------------------------------------
 
-engine: AsyncEngine = create_async_engine(
-    COMMENT_DATABASE_URL,
-    max_overflow=10,
-    pool_size=10,
-    pool_timeout=30,
-    pool_recycle=1800,
-    echo=False,
-)
-
-AsyncSessionLocal = async_sessionmaker(
-    bind=engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-)
+def build_engine() -> AsyncEngine:
+    """Creates the application's async engine and its connection pool.
+
+    Called once from the FastAPI lifespan so the pool is owned by the running
+    application and can be disposed cleanly on shutdown.
+
+    Returns:
+        AsyncEngine: A new engine bound to COMMENT_DATABASE_URL.
+    """
+    return create_async_engine(
+        COMMENT_DATABASE_URL,  # type: ignore[arg-type]
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_size=DB_POOL_SIZE,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=True,  # Detects dead connections before the first query
+        query_cache_size=DB_QUERY_CACHE_SIZE,
+        echo=False,
+    )
+
+
+def build_admin_engine() -> AsyncEngine:
+    """Creates a single-connection engine reserved for health probes.
+
+    Readiness checks run on it so frequent probes never take a connection
+    from the pool serving user requests.
+
+    Returns:
+        AsyncEngine: A new engine bound to COMMENT_DATABASE_URL with one connection.
+    """
+    return create_async_engine(
+        COMMENT_DATABASE_URL,  # type: ignore[arg-type]
+        max_overflow=0,
+        pool_size=1,
+        pool_timeout=1,
+        pool_recycle=DB_POOL_RECYCLE,
+        echo=False,
+    )
+
+
+def build_sessionmaker(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    """Creates the factory for request-scoped sessions bound to the given engine."""
+    return async_sessionmaker(
+        bind=engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
 
 # ------------------------------------------------------------------------------------
 
-async def get_async_db():
-    async with AsyncSessionLocal() as db:
+async def get_async_db(request: Request):
+    async with request.app.state.sessionmaker() as db:
         try:
             yield db
         except Exception:
             await db.rollback()
             raise
-        finally:
-            await db.close()
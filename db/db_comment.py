@@ -1,32 +1,107 @@
 from sqlalchemy import (
-    CursorResult,
-    Delete,
+    StatementLambdaElement,
+    String,
+    Update,
+    bindparam,
+    insert,
+    lambda_stmt,
     select,
     update as sql_update,
     delete as sql_delete,
 )
 from schemas.schemas_comment import (
     CommentModel,
-    CommentDisplay,
     CommentPatchModel,
     CommentUpdateModel,
 )
-from schemas.schemas_paginated_comment import Comments, PaginatedCommentDisplay
 from sqlalchemy.ext.asyncio.session import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.functions import FunctionElement
+from typing import Any
 from fastapi import HTTPException, status
 from db.models import DbComment
 
 
+class minute_timestamp(FunctionElement[str]):
+    """Formats a timestamp as 'YYYY-MM-DDTHH:MM' (UTC) inside the database.
+
+    The driver then hands back ready-to-serialize strings, so no Python
+    datetime is built or formatted per row.
+    """
+
+    type = String()
+    inherit_cache = True
+
+
+@compiles(minute_timestamp, "postgresql")
+def _minute_timestamp_postgresql(element: minute_timestamp, compiler: SQLCompiler, **kw: Any) -> str:
+    column = compiler.process(element.clauses, **kw)
+    return f"""to_char({column} AT TIME ZONE 'UTC', 'YYYY-MM-DD"T"HH24:MI')"""
+
+
+@compiles(minute_timestamp, "sqlite")
+def _minute_timestamp_sqlite(element: minute_timestamp, compiler: SQLCompiler, **kw: Any) -> str:
+    column = compiler.process(element.clauses, **kw)
+    return f"strftime('%Y-%m-%dT%H:%M', {column})"
+
+
+# Columns exposed by the display schemas, selected/returned directly instead of
+# whole ORM rows, so every row maps as is onto CommentDisplay / Comments
+COMMENT_COLUMNS = (
+    DbComment.id,
+    DbComment.user_id,
+    DbComment.post_id,
+    DbComment.text,
+    minute_timestamp(DbComment.timestamp).label("timestamp"),
+)
+
+
+# One compiled UPDATE per distinct set of patched fields, keyed by sorted field names
+_PATCH_STATEMENTS: dict[tuple[str, ...], Update] = {}
+
+
+def _patch_statement(fields: tuple[str, ...]) -> Update:
+    """Returns the cached UPDATE statement for the given set of patched fields.
+
+    Values are bound by name ('new_<field>', 'comment_id', 'current_user_id'),
+    so the same statement object, and therefore the same compiled SQL, is
+    reused by every request patching the same fields.
+
+    Args:
+        fields (tuple[str, ...]): The sorted names of the columns to update.
+
+    Returns:
+        Update: The parametrized UPDATE ... RETURNING statement.
+    """
+
+    query = _PATCH_STATEMENTS.get(fields)
+    if query is None:
+        query = (
+            sql_update(DbComment)
+            .where(
+                DbComment.id == bindparam("comment_id"),
+                DbComment.user_id == bindparam("current_user_id"),
+            )
+            .values({field: bindparam(f"new_{field}") for field in fields})
+            .returning(*COMMENT_COLUMNS)
+            .execution_options(synchronize_session=False)
+        )
+        _PATCH_STATEMENTS[fields] = query
+    return query
+
+
 async def create(
     request: CommentModel,
     db: AsyncSession,
     current_user_id: int,
-) -> CommentDisplay:
+) -> dict[str, Any]:
     """Creates a new comment and associates it with a user and a post.
 
-    This function initializes a database model using the request data and
-    the authenticated user's ID, persists it to the database, and returns
-    the validated display schema.
+    This function inserts the request data together with the authenticated
+    user's ID and uses the 'returning' clause to get back the generated ID
+    and the formatted timestamp in the same round-trip, then returns the row
+    as a display dict without re-validating it.
 
     Args:
         request (CommentModel): The incoming data containing post_id and text.
@@ -34,18 +109,20 @@ async def create(
         current_user_id (int): The ID of the user creating the comment.
 
     Returns:
-        CommentDisplay: The newly created comment, including auto-generated
-            fields like ID and timestamps.
+        dict[str, Any]: The newly created comment shaped like CommentDisplay,
+            including auto-generated fields like ID and timestamps.
     """
 
-    new_comment = DbComment(
-        user_id=current_user_id,
-        post_id=request.post_id,
-        text=request.text,
+    post_id, text = request.post_id, request.text
+    query: StatementLambdaElement = lambda_stmt(
+        lambda: insert(DbComment)
+        .values(user_id=current_user_id, post_id=post_id, text=text)
+        .returning(*COMMENT_COLUMNS)
     )
-    db.add(new_comment)
+    result = await db.execute(query)
+    new_comment = result.mappings().one()
     await db.commit()
-    return CommentDisplay.model_validate(new_comment)
+    return dict(new_comment)
 
 
 # --------------------------------------------------------------------------
@@ -55,12 +132,19 @@ async def read_all(
     limit: int,
     last_id: int | None,
     db: AsyncSession,
-) -> PaginatedCommentDisplay:
+) -> dict[str, Any]:
     """Retrieves a paginated list of comments using keyset pagination.
 
     This function fetches one extra record beyond the limit to determine if
     there are more pages. It uses the comment ID as a cursor for efficient
-    sorting and filtering.
+    sorting and filtering, and only selects the displayed columns so no ORM
+    objects are built for the page. The page is returned as plain dicts
+    shaped like PaginatedCommentDisplay, ready to be serialized as is.
+
+    The feed is ordered by ID alone: IDs are allocated in insertion order and
+    the timestamp defaults to the insertion time, so 'id < last_id' is an
+    exact keyset predicate served by a backward scan of the primary key,
+    without a compound (timestamp, id) cursor.
 
     Args:
         limit (int): The maximum number of comments to return per page.
@@ -69,32 +153,32 @@ async def read_all(
         db (AsyncSession): The asynchronous database session.
 
     Returns:
-        PaginatedCommentDisplay: A schema containing the list of comments,
-             the next_cursor, and a boolean indicating if more pages exist.
+        dict[str, Any]: The PaginatedCommentDisplay content: the list of
+             comments, the next_cursor, and a boolean indicating if more
+             pages exist.
     """
 
-    if last_id:
-        query = (
-            select(DbComment)
-            .order_by(DbComment.id.desc())
-            .limit(limit + 1)
-            .where(DbComment.id < last_id)
-        )
-    else:
-        query = select(DbComment).order_by(DbComment.id.desc()).limit(limit + 1)
+    fetch = limit + 1
+    query: StatementLambdaElement = lambda_stmt(
+        lambda: select(*COMMENT_COLUMNS).order_by(DbComment.id.desc()).limit(fetch)
+    )
+    if last_id is not None:
+        query += lambda s: s.where(DbComment.id < last_id)
 
+    # One buffered fetch: LimitQuery caps the query at 100 + 1 small rows, so a server-side
+    # cursor would only add round-trips, and the ETag needs the complete body anyway
     result = await db.execute(query)
-    comment = result.scalars().all()
+    rows = result.mappings().all()
 
-    items = comment[:limit]
-    next_cursor: int | None = items[-1].id if items else None
-    has_more: bool = len(comment) > limit
+    items = [dict(row) for row in rows[:limit]]
+    next_cursor: int | None = items[-1]["id"] if items else None
+    has_more: bool = len(rows) > limit
 
-    return PaginatedCommentDisplay(
-        items=[Comments.model_validate(c) for c in items],
-        next_cursor=next_cursor if has_more else None,
-        has_more=has_more,
-    )
+    return {
+        "items": items,
+        "next_cursor": next_cursor if has_more else None,
+        "has_more": has_more,
+    }
 
 
 # --------------------------------------------------------------------------
@@ -105,12 +189,13 @@ async def update(
     request: CommentUpdateModel,
     db: AsyncSession,
     current_user_id: int,
-) -> CommentDisplay:
+) -> dict[str, Any]:
     """Replaces the content of an existing comment.
 
     This function performs an authorized update of a comment's text. It uses
-    the 'returning' clause to fetch the updated record in a single database
-    transaction for better performance.
+    the 'returning' clause to fetch the updated columns in a single database
+    round-trip, and skips session synchronization since no ORM object for the
+    comment is loaded in the session.
 
     Args:
         comment_id (int): The ID of the comment to be updated.
@@ -120,21 +205,23 @@ async def update(
             (used to verify ownership).
 
     Returns:
-        CommentDisplay: The updated comment record validated against the display schema.
+        dict[str, Any]: The updated comment record shaped like CommentDisplay.
 
     Raises:
         HTTPException: 404 status if the comment does not exist or if the
             current_user_id does not match the comment's owner_id.
     """
 
-    query = (
-        sql_update(DbComment)
+    text = request.text
+    query: StatementLambdaElement = lambda_stmt(
+        lambda: sql_update(DbComment)
         .where(DbComment.id == comment_id, DbComment.user_id == current_user_id)
-        .values(text=request.text)
-        .returning(DbComment)
+        .values(text=text)
+        .returning(*COMMENT_COLUMNS)
+        .execution_options(synchronize_session=False)
     )
     result = await db.execute(query)
-    comment: DbComment | None = result.scalar_one_or_none()
+    comment = result.mappings().one_or_none()
     if not comment:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -142,7 +229,7 @@ async def update(
         )
 
     await db.commit()
-    return CommentDisplay.model_validate(comment)
+    return dict(comment)
 
 
 # --------------------------------------------------------------------------
@@ -153,7 +240,7 @@ async def patch(
     request: CommentPatchModel,
     db: AsyncSession,
     current_user_id: int,
-) -> CommentDisplay:
+) -> dict[str, Any]:
     """Updates an existing comment partially.
 
     This function performs an 'atomic update' by only modifying the fields
@@ -167,27 +254,31 @@ async def patch(
         current_user_id (int): The ID of the user attempting the update.
 
     Returns:
-        CommentDisplay: The updated comment record.
+        dict[str, Any]: The updated comment record shaped like CommentDisplay.
 
     Raises:
+        HTTPException: 400 error if the request contains no field to update,
+            without touching the database.
         HTTPException: 404 error if the comment doesn't exist or the user
             doesn't have permission to edit it.
     """
 
-    updated_data = request.model_dump(exclude_unset=True)
-
-    query = (
-        sql_update(DbComment)
-        .where(
-            DbComment.id == comment_id,
-            DbComment.user_id == current_user_id,
+    # Null values are dropped too, the display schema cannot represent a null text
+    updated_data = request.model_dump(exclude_unset=True, exclude_none=True)
+    if not updated_data:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No fields to update.",
         )
-        .values(**updated_data)  # Unpack the dict into the update query
-        .returning(DbComment)
-    )
 
-    result = await db.execute(query)
-    comment: DbComment | None = result.scalar_one_or_none()
+    query = _patch_statement(tuple(sorted(updated_data)))
+    params = {f"new_{field}": value for field, value in updated_data.items()}
+
+    result = await db.execute(
+        query,
+        {"comment_id": comment_id, "current_user_id": current_user_id, **params},
+    )
+    comment = result.mappings().one_or_none()
     if not comment:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -195,7 +286,7 @@ async def patch(
         )
 
     await db.commit()
-    return CommentDisplay.model_validate(comment)
+    return dict(comment)
 
 
 # --------------------------------------------------------------------------
@@ -205,8 +296,8 @@ async def delete(comment_id: int, db: AsyncSession, current_user_id: int) -> Non
     """Deletes a specific comment from the database.
 
     The operation only succeeds if the comment exists and belongs to the
-    requesting user. If no record matches both the ID and the owner_id,
-    no rows are deleted and the function returns silently.
+    requesting user. The 'returning' clause reports the deleted ID, so the
+    existence check needs no extra query or rowcount inspection.
 
     Args:
         comment_id (int): The unique identifier of the comment to be removed.
@@ -216,19 +307,27 @@ async def delete(comment_id: int, db: AsyncSession, current_user_id: int) -> Non
 
     Returns:
         None
+
+    Raises:
+        HTTPException: 400 status if no record matches both the ID and the
+            owner_id.
     """
 
-    query: Delete = sql_delete(DbComment).where(
-        DbComment.id == comment_id,
-        DbComment.user_id == current_user_id,
+    query: StatementLambdaElement = lambda_stmt(
+        lambda: sql_delete(DbComment)
+        .where(
+            DbComment.id == comment_id,
+            DbComment.user_id == current_user_id,
+        )
+        .returning(DbComment.id)
+        .execution_options(synchronize_session=False)
     )
     result = await db.execute(query)
-    if isinstance(result, CursorResult):
-        if result.rowcount == 0:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Comment either not found or unauthorized",
-            )
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Comment either not found or unauthorized",
+        )
 
     await db.commit()
     return None
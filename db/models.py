@@ -1,4 +1,4 @@
-from sqlalchemy import Integer, String, DateTime, func
+from sqlalchemy import Index, Integer, String, DateTime, func
 from sqlalchemy.orm import Mapped, mapped_column
 from datetime import datetime
 from db.database import Base
@@ -7,12 +7,15 @@ from db.database import Base
 
 class DbComment(Base):
     __tablename__: str = "comment"
+    __table_args__ = (
+        # Serves "comments of a post" keyset pagination (post_id = ? AND id < ?
+        # ORDER BY id DESC) and plain post_id lookups, as the leading column
+        Index("ix_comment_post_id_id", "post_id", "id"),
+    )
     id: Mapped[int] = mapped_column(
         Integer,
-        primary_key=True,
-        unique=True,
+        primary_key=True,  # pk_comment already provides the unique btree index
         nullable=False,
-        index=True,
         comment="Unique identifier for the comment (Auto-incrementing PK).",
     )
     user_id: Mapped[int] = mapped_column(
@@ -28,7 +31,7 @@ class DbComment(Base):
         primary_key=False,
         unique=False,
         nullable=False,
-        index=True,
+        index=False,  # Covered by ix_comment_post_id_id
         comment="Unique identifier for the post where the comment is written",
     )
     text: Mapped[str] = mapped_column(
@@ -44,372 +44,319 @@ from sqlalchemy.exc import (
 )
 from fastapi.exceptions import RequestValidationError
 from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
+from dataclasses import dataclass, field
 import logging
+import orjson
 
 logger: logging.Logger = logging.getLogger(__name__)
 
 
-def add_exception_handlers(app: FastAPI) -> None:
-    """Registers global exception handlers for the FastAPI application.
-
-    This function maps specific exception types (Database, Validation, Timeout)
-    to standardized JSON responses. It ensures that internal server errors
-    are logged but not exposed to the client, while validation errors provide
-    actionable feedback.
+@dataclass(frozen=True, slots=True)
+class ErrorSpec:
+    """How an exception type is logged and turned into a JSON response.
 
-    Args:
-        app (FastAPI): The main application instance to attach handlers to.
+    The body is serialized once, at import, with "No hint found" when 'content'
+    has no "hint" key. It is only rebuilt for an exception that carries its own
+    hint and when 'content' does not already set one.
     """
 
-    # --- DATA & VALUE ERRORS ---
-    @app.exception_handler(DataError)
-    @app.exception_handler(IdentifierError)
-    async def data_value_handler(request: Request, exc: Exception) -> JSONResponse:
-        statement = getattr(exc, "statement", "Unknown SQL")
-        params = getattr(exc, "params", "No params")
-        logger.error(
-            f"Database Data Error: {exc} | Statement: {statement} | Params: {params}",
-            exc_info=True,
-        )
-        return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content={
-                "detail": "The data provided is incompatible with the database constraints.",
-                "hint": getattr(exc, "hint", "No hint found"),
-            },
-        )
-
-    # --- EXECUTION STATE ERRORS ---
-    @app.exception_handler(MultipleResultsFound)
-    @app.exception_handler(NoResultFound)
-    @app.exception_handler(ResourceClosedError)
-    @app.exception_handler(IllegalStateChangeError)
-    async def execution_state_handler(request: Request, exc: Exception) -> JSONResponse:
-        statement = getattr(exc, "statement", "Unknown SQL")
-        params = getattr(exc, "params", "No params")
-        logger.error(
-            f"Execution State Error: {exc} | Statement: {statement} | Params: {params}"
-        )
-
-        # Determine status code based on exception type
-        status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
-        if isinstance(exc, NoResultFound):
-            status_code = status.HTTP_404_NOT_FOUND
+    log_level: int
+    log_label: str
+    status_code: int
+    content: dict[str, str]
+    exc_info: bool = False
+    body: bytes = field(init=False)
 
-        return JSONResponse(
-            status_code=status_code,
-            content={
-                "detail": "A database execution error occurred.",
-                "hint": getattr(exc, "hint", "No hint found"),
-            },
-        )
-
-    # --- SPECIFIC DATABASE ERRORS ---
-
-    @app.exception_handler(IntegrityError)
-    async def integrity_exception_handler(
-        request: Request,
-        exc: IntegrityError,
-    ) -> JSONResponse:
-        statement = getattr(exc, "statement", "Unknown SQL")
-        params = getattr(exc, "params", "No params")
-        logger.error(
-            f"Database Integrity Error: {exc} | Statement: {statement} | Params: {params}"
-        )
-        return JSONResponse(
-            status_code=status.HTTP_409_CONFLICT,
-            content={
-                "detail": "Data conflict: (likely email or username) already exists.",
-                "hint": getattr(exc, "hint", "No hint found"),
-            },
-        )
-
-    @app.exception_handler(NoReferencedTableError)
-    async def no_referenced_table_handler(
-        request: Request,
-        exc: NoReferencedTableError,
-    ) -> JSONResponse:
-        # We log this as CRITICAL because it means the database schema is broken/missing
-        statement = getattr(exc, "statement", "Unknown SQL")
-        params = getattr(exc, "params", "No params")
-        logger.critical(
-            f"Schema Error: {exc} | Statement: {statement} | Params: {params}"
-        )
-
-        return JSONResponse(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content={
-                "detail": "Database schema error: A required table does not exist.",
-                "technical_context": "Run migrations (Alembic) to ensure the schema is up to date.",
-                "hint": getattr(exc, "hint", "No hint found"),
-            },
-        )
+    def __post_init__(self) -> None:
+        body = orjson.dumps({**self.content, "hint": self.content.get("hint", "No hint found")})
+        # Frozen dataclass: the derived field is set once, bypassing __setattr__
+        object.__setattr__(self, "body", body)
 
-    @app.exception_handler(ProgrammingError)
-    async def programming_error_handler(
-        request: Request,
-        exc: ProgrammingError,
-    ) -> JSONResponse:
-        # Get the raw error from the asyncpg driver
-        # PostgreSQL Error Code 42P01 = undefined_table
-        raw_error = getattr(exc.orig, "sqlstate", None)
+    def render(self, exc: Exception) -> bytes:
+        hint = getattr(exc, "hint", None)
+        if hint is None or "hint" in self.content:
+            return self.body
+        return orjson.dumps({**self.content, "hint": hint}, default=str)
 
-        if raw_error == "42P01":
-            statement = getattr(exc, "statement", "Unknown SQL")
-            params = getattr(exc, "params", "No params")
-            logger.critical(
-                f"CRITICAL: Database table missing (42P01) | Statement: {statement} | Params: {params}"
-            )
-            return JSONResponse(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                content={
-                    "detail": "Database schema error: A required table does not exist.",
-                    "solution": "Run 'alembic upgrade head' to create the missing tables.",
-                    "hint": getattr(exc, "hint", "No hint found"),
-                },
-            )
 
-        if raw_error == "42703":
-            statement = getattr(exc, "statement", "Unknown SQL")
-            params = getattr(exc, "params", "No params")
-            logger.critical(
-                f"CRITICAL: Database column mismatch (42703) | Statement: {statement} | Params: {params}"
-            )
-            return JSONResponse(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                content={
-                    "detail": "Database schema error: A column referenced in the code does not exist in the database.",
-                    "solution": "Generate and run a new migration: 'alembic revision --autogenerate' followed by 'alembic upgrade head'.",
-                    "hint": getattr(exc, "hint", "No hint found"),
-                },
-            )
+def _specs(
+    exc_types: tuple[type[Exception], ...], spec: ErrorSpec
+) -> dict[type[Exception], ErrorSpec]:
+    return {exc_type: spec for exc_type in exc_types}
 
-        return JSONResponse(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content={
-                "detail": f"Internal Database Command Failed: raw_error: {raw_error}",
-                "hint": getattr(exc, "hint", "No hint found"),
-            },
-        )
 
+# Built once at import. Lookups walk the raised exception's MRO, so the most
+# specific registered class wins, exactly like Starlette's own handler lookup.
+ERROR_SPECS: dict[type[Exception], ErrorSpec] = {
+    # --- DATA & VALUE ERRORS ---
+    **_specs(
+        (DataError, IdentifierError),
+        ErrorSpec(
+            logging.ERROR,
+            "Database Data Error",
+            status.HTTP_400_BAD_REQUEST,
+            {"detail": "The data provided is incompatible with the database constraints."},
+            exc_info=True,
+        ),
+    ),
+    # --- EXECUTION STATE ERRORS ---
+    **_specs(
+        (MultipleResultsFound, ResourceClosedError, IllegalStateChangeError),
+        ErrorSpec(
+            logging.ERROR,
+            "Execution State Error",
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            {"detail": "A database execution error occurred."},
+        ),
+    ),
+    NoResultFound: ErrorSpec(
+        logging.ERROR,
+        "Execution State Error",
+        status.HTTP_404_NOT_FOUND,
+        {"detail": "A database execution error occurred."},
+    ),
+    # --- SPECIFIC DATABASE ERRORS ---
+    IntegrityError: ErrorSpec(
+        logging.ERROR,
+        "Database Integrity Error",
+        status.HTTP_409_CONFLICT,
+        {"detail": "Data conflict: (likely email or username) already exists."},
+    ),
+    # We log this as CRITICAL because it means the database schema is broken/missing
+    NoReferencedTableError: ErrorSpec(
+        logging.CRITICAL,
+        "Schema Error",
+        status.HTTP_500_INTERNAL_SERVER_ERROR,
+        {
+            "detail": "Database schema error: A required table does not exist.",
+            "technical_context": "Run migrations (Alembic) to ensure the schema is up to date.",
+        },
+    ),
+    ProgrammingError: ErrorSpec(
+        logging.ERROR,
+        "Database Command Error",
+        status.HTTP_500_INTERNAL_SERVER_ERROR,
+        {"detail": "Internal Database Command Failed."},
+    ),
     # --- CONNECTION & POOL ERRORS ---
-    @app.exception_handler(DisconnectionError)
-    @app.exception_handler(InvalidatePoolError)
-    @app.exception_handler(InterfaceError)
-    @app.exception_handler(DBAPIError)
-    async def connection_management_handler(
-        request: Request, exc: Exception
-    ) -> JSONResponse:
-        statement = getattr(exc, "statement", "Unknown SQL")
-        params = getattr(exc, "params", "No params")
-        logger.critical(
-            f"\nDatabase Connection/Pool Error: {exc} | Statement: {statement} | Params: {params}\n"
-        )
-        return JSONResponse(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            content={
-                "detail": "Database communication failure. The service is temporarily unavailable.",
-                "hint": getattr(exc, "hint", "No hint found"),
-            },
-        )
-
+    **_specs(
+        (DisconnectionError, InvalidatePoolError, InterfaceError, DBAPIError),
+        ErrorSpec(
+            logging.CRITICAL,
+            "Database Connection/Pool Error",
+            status.HTTP_503_SERVICE_UNAVAILABLE,
+            {"detail": "Database communication failure. The service is temporarily unavailable."},
+        ),
+    ),
+    OperationalError: ErrorSpec(
+        logging.CRITICAL,
+        "DB Connection Error",
+        status.HTTP_503_SERVICE_UNAVAILABLE,
+        {"detail": "Database connection failed. Please check if the DB is running."},
+        exc_info=True,
+    ),
     # --- STATEMENT & COMPILATION ERRORS ---
-    @app.exception_handler(StatementError)
-    @app.exception_handler(ObjectNotExecutableError)
-    @app.exception_handler(UnboundExecutionError)
-    @app.exception_handler(NotSupportedError)
-    async def statement_error_handler(request: Request, exc: Exception) -> JSONResponse:
-        statement = getattr(exc, "statement", "Unknown SQL")
-        params = getattr(exc, "params", "No params")
-        logger.error(
-            f"SQL Statement Error: {exc} | Statement: {statement} | Params: {params}"
-        )
-        return JSONResponse(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content={
-                "detail": "The database received an invalid command.",
-                "hint": getattr(exc, "hint", "No hint found"),
-            },
-        )
-
+    **_specs(
+        (StatementError, ObjectNotExecutableError, UnboundExecutionError, NotSupportedError),
+        ErrorSpec(
+            logging.ERROR,
+            "SQL Statement Error",
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            {"detail": "The database received an invalid command."},
+        ),
+    ),
     # --- TRANSACTION & SESSION ERRORS ---
-    @app.exception_handler(PendingRollbackError)
-    @app.exception_handler(InvalidRequestError)
-    @app.exception_handler(MissingGreenlet)
-    async def session_lifecycle_handler(
-        request: Request, exc: Exception
-    ) -> JSONResponse:
-        statement = getattr(exc, "statement", "Unknown SQL")
-        params = getattr(exc, "params", "No params")
-        logger.critical(
-            f"Database Session Error: {exc} | Statement: {statement} | Params: {params}"
-        )
-        return JSONResponse(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content={
+    **_specs(
+        (PendingRollbackError, InvalidRequestError, MissingGreenlet),
+        ErrorSpec(
+            logging.CRITICAL,
+            "Database Session Error",
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            {
                 "detail": "A database session error occurred. The transaction may have failed.",
                 "hint": "The session requires a rollback or was used incorrectly across threads/tasks.",
             },
-        )
-
+        ),
+    ),
     # --- ENGINE & METADATA ERRORS ---
-    @app.exception_handler(InternalError)
-    @app.exception_handler(DatabaseError)
-    @app.exception_handler(NoInspectionAvailable)
-    @app.exception_handler(UnreflectableTableError)
-    async def engine_metadata_handler(request: Request, exc: Exception) -> JSONResponse:
-        statement = getattr(exc, "statement", "Unknown SQL")
-        params = getattr(exc, "params", "No params")
-        logger.critical(
-            f"Database Engine Internal Error: {exc} | Statement: {statement} | Params: {params}"
-        )
-        return JSONResponse(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content={
-                "detail": "The database engine encountered an internal failure.",
-                "hint": getattr(exc, "hint", "No hint found"),
-            },
-        )
-
+    **_specs(
+        (InternalError, DatabaseError, NoInspectionAvailable, UnreflectableTableError),
+        ErrorSpec(
+            logging.CRITICAL,
+            "Database Engine Internal Error",
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            {"detail": "The database engine encountered an internal failure."},
+        ),
+    ),
     # --- RELATIONSHIP LINKAGE ERRORS ---
-    @app.exception_handler(NoForeignKeysError)
-    @app.exception_handler(NoReferencedColumnError)
-    @app.exception_handler(NoReferenceError)
-    async def relationship_linkage_handler(
-        request: Request, exc: Exception
-    ) -> JSONResponse:
-        statement = getattr(exc, "statement", "Unknown SQL")
-        params = getattr(exc, "params", "No params")
-        logger.error(
-            f"Database Relationship Linkage Error: {exc} | Statement: {statement} | Params: {params}"
-        )
-        return JSONResponse(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content={
+    **_specs(
+        (NoForeignKeysError, NoReferencedColumnError, NoReferenceError),
+        ErrorSpec(
+            logging.ERROR,
+            "Database Relationship Linkage Error",
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            {
                 "detail": "Database relationship configuration error.",
                 "hint": "A foreign key or referenced column is missing from the schema.",
             },
-        )
-
+        ),
+    ),
     # --- INTERNAL LOGIC & CODING ERRORS ---
-    @app.exception_handler(ArgumentError)
-    @app.exception_handler(AwaitRequired)
-    @app.exception_handler(UnsupportedCompilationError)
-    @app.exception_handler(CompileError)
-    async def internal_logic_handler(request: Request, exc: Exception) -> JSONResponse:
-        statement = getattr(exc, "statement", "Unknown SQL")
-        params = getattr(exc, "params", "No params")
-        logger.error(
-            f"SQLAlchemy Logic Error: {exc} | Statement: {statement} | Params: {params}"
-        )
-        return JSONResponse(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content={
-                "detail": "A database logic error occurred.",
-                "hint": getattr(exc, "hint", "No hint found"),
-            },
-        )
-
+    **_specs(
+        (ArgumentError, AwaitRequired, UnsupportedCompilationError, CompileError),
+        ErrorSpec(
+            logging.ERROR,
+            "SQLAlchemy Logic Error",
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            {"detail": "A database logic error occurred."},
+        ),
+    ),
     # --- COMPLEX SCHEMA & RELATIONSHIP ERRORS ---
-    @app.exception_handler(AmbiguousForeignKeysError)
-    @app.exception_handler(CircularDependencyError)
-    @app.exception_handler(ConstraintColumnNotFoundError)
-    @app.exception_handler(DuplicateColumnError)
-    async def schema_logic_handler(request: Request, exc: Exception) -> JSONResponse:
-        statement = getattr(exc, "statement", "Unknown SQL")
-        params = getattr(exc, "params", "No params")
-        logger.critical(
-            f"Database Relationship Error: {exc} | Statement: {statement} | Params: {params}"
-        )
-        return JSONResponse(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content={
+    **_specs(
+        (
+            AmbiguousForeignKeysError,
+            CircularDependencyError,
+            ConstraintColumnNotFoundError,
+            DuplicateColumnError,
+        ),
+        ErrorSpec(
+            logging.CRITICAL,
+            "Database Relationship Error",
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            {
                 "detail": "Database schema relationship error.",
                 "hint": "Check your model relationships and foreign key definitions.",
             },
-        )
-
+        ),
+    ),
     # --- SCHEMA REFLECTION ERRORS ---
-
-    @app.exception_handler(NoSuchTableError)
-    @app.exception_handler(NoSuchColumnError)
-    async def schema_mismatch_handler(request: Request, exc: Exception) -> JSONResponse:
-        statement = getattr(exc, "statement", "Unknown SQL")
-        params = getattr(exc, "params", "No params")
-        logger.critical(
-            f"Schema Mismatch: {exc} | Statement: {statement} | Params: {params}"
-        )
-
-        return JSONResponse(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content={
+    **_specs(
+        (NoSuchTableError, NoSuchColumnError),
+        ErrorSpec(
+            logging.CRITICAL,
+            "Schema Mismatch",
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            {
                 "detail": "Database structure mismatch.",
                 "hint": "The application is trying to access a table or column that does not exist.",
             },
-        )
-
+        ),
+    ),
     # --- CONFIGURATION ERRORS ---
+    NoSuchModuleError: ErrorSpec(
+        logging.CRITICAL,
+        "Dependency Error",
+        status.HTTP_500_INTERNAL_SERVER_ERROR,
+        {
+            "detail": "Server configuration error: A required database driver is missing.",
+            "hint": "Check if 'asyncpg' or 'psycopg2' is installed in the environment.",
+        },
+    ),
+    # --- TIMEOUT ---
+    TimeoutError: ErrorSpec(
+        logging.ERROR,
+        "Database Timeout Error",
+        status.HTTP_504_GATEWAY_TIMEOUT,
+        {"detail": "The database took too long to respond."},
+    ),
+    # --- GENERAL DATABASE ERROR (Parent) ---
+    SQLAlchemyError: ErrorSpec(
+        logging.ERROR,
+        "General Database Error",
+        status.HTTP_500_INTERNAL_SERVER_ERROR,
+        {"detail": "A database error occurred. Please try again later."},
+        exc_info=True,
+    ),
+    # --- UNIVERSAL CATCH-ALL (The Ultimate Parent) ---
+    Exception: ErrorSpec(
+        logging.ERROR,
+        "Uncaught Exception",
+        status.HTTP_500_INTERNAL_SERVER_ERROR,
+        {"detail": "A critical server error occurred."},
+        exc_info=True,
+    ),
+}
+
+# PostgreSQL error codes raised as ProgrammingError that point to a stale schema
+SQLSTATE_SPECS: dict[str, ErrorSpec] = {
+    # 42P01 = undefined_table
+    "42P01": ErrorSpec(
+        logging.CRITICAL,
+        "CRITICAL: Database table missing (42P01)",
+        status.HTTP_500_INTERNAL_SERVER_ERROR,
+        {
+            "detail": "Database schema error: A required table does not exist.",
+            "solution": "Run 'alembic upgrade head' to create the missing tables.",
+        },
+    ),
+    # 42703 = undefined_column
+    "42703": ErrorSpec(
+        logging.CRITICAL,
+        "CRITICAL: Database column mismatch (42703)",
+        status.HTTP_500_INTERNAL_SERVER_ERROR,
+        {
+            "detail": "Database schema error: A column referenced in the code does not exist in the database.",
+            "solution": "Generate and run a new migration: 'alembic revision --autogenerate' followed by 'alembic upgrade head'.",
+        },
+    ),
+}
+
+
+def find_error_spec(exc: Exception) -> ErrorSpec:
+    """Returns the ErrorSpec registered for the closest class in the exception's MRO.
 
-    @app.exception_handler(NoSuchModuleError)
-    async def module_error_handler(
-        request: Request, exc: NoSuchModuleError
-    ) -> JSONResponse:
-        statement = getattr(exc, "statement", "Unknown SQL")
-        params = getattr(exc, "params", "No params")
-        logger.critical(
-            f"Dependency Error: {exc} | Statement: {statement} | Params: {params}"
-        )
+    Args:
+        exc (Exception): The raised exception.
 
-        return JSONResponse(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content={
-                "detail": "Server configuration error: A required database driver is missing.",
-                "hint": "Check if 'asyncpg' or 'psycopg2' is installed in the environment.",
-            },
-        )
+    Returns:
+        ErrorSpec: The logging and response settings to apply.
+    """
 
-    # --- GENERAL DATABASE ERROR (Parent) ---
+    if isinstance(exc, ProgrammingError):
+        # Get the raw error from the asyncpg driver
+        sqlstate = getattr(exc.orig, "sqlstate", None)
+        if sqlstate in SQLSTATE_SPECS:
+            return SQLSTATE_SPECS[sqlstate]
+    for exc_type in type(exc).__mro__:
+        spec = ERROR_SPECS.get(exc_type)
+        if spec is not None:
+            return spec
+    return ERROR_SPECS[Exception]
 
-    @app.exception_handler(SQLAlchemyError)
-    async def sqlalchemy_exception_handler(
-        request: Request,
-        exc: SQLAlchemyError,
-    ) -> JSONResponse:
-        statement = getattr(exc, "statement", "No statement found")
-        params = getattr(exc, "params", "No params found")
-        logger.error(
-            f"General Database Error: {type(exc).__name__} | Statement: {statement} | Params: {params}",
-            exc_info=True,
-        )
-        return JSONResponse(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content={
-                "detail": "A database error occurred. Please try again later.",
-                "hint": getattr(exc, "hint", "No hint found"),
-            },
-        )
 
-    @app.exception_handler(OperationalError)
-    async def operational_handler(
-        request: Request,
-        exc: OperationalError,
-    ) -> JSONResponse:
-        statement = getattr(exc, "statement", "No statement found")
-        params = getattr(exc, "params", "No params found")
-        logger.critical(
-            f"DB Connection Error: {type(exc).__name__} | Statement: {statement} | Params: {params}",
-            exc_info=True,
+def add_exception_handlers(app: FastAPI) -> None:
+    """Registers global exception handlers for the FastAPI application.
+
+    Database and unexpected errors go through a single handler that looks up
+    the matching ErrorSpec and maps it to a standardized JSON response. It
+    ensures that internal server errors are logged but not exposed to the
+    client, while validation errors provide actionable feedback.
+
+    Args:
+        app (FastAPI): The main application instance to attach handlers to.
+    """
+
+    # --- DATABASE & UNCAUGHT ERRORS ---
+
+    @app.exception_handler(SQLAlchemyError)
+    @app.exception_handler(Exception)
+    async def error_spec_handler(request: Request, exc: Exception) -> Response:
+        spec = find_error_spec(exc)
+        statement = getattr(exc, "statement", "Unknown SQL")
+        params = getattr(exc, "params", "No params")
+        logger.log(
+            spec.log_level,
+            f"{spec.log_label}: {exc} | Statement: {statement} | Params: {params}",
+            exc_info=spec.exc_info,
         )
-        return JSONResponse(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            content={
-                "detail": "Database connection failed. Please check if the DB is running.",
-                "hint": getattr(exc, "hint", "No hint found"),
-            },
+        return Response(
+            content=spec.render(exc),
+            status_code=spec.status_code,
+            media_type="application/json",
         )
 
-    # --- VALIDATION & TIMEOUT ---
+    # --- VALIDATION ---
 
     @app.exception_handler(RequestValidationError)
     async def validation_exception_handler(
@@ -425,40 +372,3 @@ def add_exception_handlers(app: FastAPI) -> None:
                 "errors": errors,
             },
         )
-
-    @app.exception_handler(TimeoutError)
-    async def timeout_handler(
-        request: Request,
-        exc: TimeoutError,
-    ) -> JSONResponse:
-        statement = getattr(exc, "statement", "Unknown SQL")
-        params = getattr(exc, "params", "No params")
-        logger.error(f"Error: {exc} | Statement: {statement} | Params: {params}")
-        return JSONResponse(
-            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
-            content={
-                "detail": "The database took too long to respond.",
-                "hint": getattr(exc, "hint", "No hint found"),
-            },
-        )
-
-    # --- UNIVERSAL CATCH-ALL (The Ultimate Parent) ---
-
-    @app.exception_handler(Exception)
-    async def universal_handler(
-        request: Request,
-        exc: Exception,
-    ) -> JSONResponse:
-        statement = getattr(exc, "statement", "Unknown SQL")
-        params = getattr(exc, "params", "No params")
-        logger.error(
-            f"Uncaught Exception: {exc} | Statement: {statement} | Params: {params}",
-            exc_info=True,
-        )
-        return JSONResponse(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content={
-                "detail": "A critical server error occurred.",
-                "hint": getattr(exc, "hint", "No hint found"),
-            },
-        )
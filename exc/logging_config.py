@@ -1,17 +1,24 @@
 from logging import LogRecord
-from core.context import request_id_ctx
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from core.context import request_ctx
 from typing import Any, Literal
 import logging.config
+import queue
 import os
 
 class ContextFilter(logging.Filter):
     def filter(self, record: LogRecord) -> Literal[True]:
-        record.request_id = request_id_ctx.get()
+        ctx = request_ctx.get()
+        # Unsampled requests only get their ID on WARNING+ records
+        if ctx.sampled or record.levelno >= logging.WARNING:
+            record.request_id = ctx.id
+        else:
+            record.request_id = "-"
         return True
 
-# Create a logs directory if it doesn't exist
-if not os.path.exists("exc/logs"):
-    os.makedirs("exc/logs")
+# WARNING+ records are queued here and written to disk by a QueueListener thread,
+# so request handlers never block the event loop on file writes or rotation
+LOG_QUEUE: queue.Queue[LogRecord] = queue.Queue(-1)
 
 LOGGING_CONFIG: dict[str, Any] = {
     "version": 1,
@@ -32,25 +39,42 @@ LOGGING_CONFIG: dict[str, Any] = {
             "formatter": "standard",
             "filters": ["request_id_filter"],
         },
-        "file_handler": {
+        "queue_handler": {
             "level": "WARNING",  # This saves WARNING, ERROR, and CRITICAL to the file
-            "class": "logging.handlers.RotatingFileHandler",
-            "filename": "exc/logs/app_errors.log",
-            "maxBytes": 5242880,  # 5MB per file
-            "backupCount": 5,     # Keep the last 5 old log files
-            "formatter": "detailed",
-            "filters": ["request_id_filter"],
-            "encoding": "utf8",
+            "()": QueueHandler,
+            "queue": LOG_QUEUE,
+            "filters": ["request_id_filter"],  # Runs before enqueue, in the request's context
         },
     },
     "loggers": {
         "": {  # Root logger
-            "handlers": ["console", "file_handler"],
+            "handlers": ["console", "queue_handler"],
             "level": "INFO",
             "propagate": True,
         },
     },
 }
 
-def setup_logging() -> None:
-    logging.config.dictConfig(LOGGING_CONFIG)
\ No newline at end of file
+def _build_file_handler() -> RotatingFileHandler:
+    # Create a logs directory if it doesn't exist
+    if not os.path.exists("exc/logs"):
+        os.makedirs("exc/logs")
+    file_handler = RotatingFileHandler(
+        "exc/logs/app_errors.log",
+        maxBytes=5242880,  # 5MB per file
+        backupCount=5,     # Keep the last 5 old log files
+        encoding="utf8",
+    )
+    file_handler.setLevel(logging.WARNING)
+    file_handler.setFormatter(
+        logging.Formatter(LOGGING_CONFIG["formatters"]["detailed"]["format"])
+    )
+    return file_handler
+
+def setup_logging() -> QueueListener:
+    # Called from the app's lifespan, so importing the app (tests, scripts,
+    # alembic) never attaches the file handler. The caller stops the listener.
+    logging.config.dictConfig(LOGGING_CONFIG)
+    listener = QueueListener(LOG_QUEUE, _build_file_handler(), respect_handler_level=True)
+    listener.start()
+    return listener
@@ -1,20 +1,53 @@
+from contextlib import asynccontextmanager
+from collections.abc import AsyncIterator
 from exc.exceptions import add_exception_handlers
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from exc.logging_config import setup_logging
 from middleware.correlation import CorrelationIdMiddleware
-from router import comment
+from db.database import build_admin_engine, build_engine, build_sessionmaker
+from router import comment, health
+from sqlalchemy import text
 
-setup_logging()
+# -----------------------------------------------------------------------------------------------
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    listener = setup_logging()
+    # Build the pool once per process and warm it up before serving traffic
+    engine = build_engine()
+    app.state.engine = engine
+    app.state.sessionmaker = build_sessionmaker(engine)
+    app.state.admin_engine = build_admin_engine()
+    async with engine.begin() as conn:
+        await conn.execute(text("SELECT 1"))
+    yield
+    await app.state.admin_engine.dispose()
+    await engine.dispose()
+    listener.stop()
 
 # -----------------------------------------------------------------------------------------------
 
-app = FastAPI(root_path="/comment")
+app = FastAPI(
+    root_path="/comment",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,  # orjson instead of stdlib json for every route
+)
 app.add_middleware(CorrelationIdMiddleware)
 
 # -----------------------------------------------------------------------------------------------
 
+app.include_router(health.router)
 app.include_router(comment.router)
 
 # -----------------------------------------------------------------------------------------------
 
-add_exception_handlers(app)
\ No newline at end of file
+add_exception_handlers(app)
+
+# -----------------------------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    # Local entry point, same module path as the Docker CMD (uvicorn main:app)
+    import uvicorn
+
+    uvicorn.run("main:app", host="0.0.0.0", port=8000)
@@ -1,20 +1,54 @@
-import uuid
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from core.context import request_id_ctx
-
-class CorrelationIdMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next) -> Response:
-        # Use existing ID from header (if any), otherwise generate new
-        corr_id = request.headers.get("X-Request-ID", str(uuid.uuid4()))
-        
+import random
+import secrets
+import os
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from core.context import ReqCtx, request_ctx
+
+# Share of requests whose INFO logs are tagged with the request ID (0.0 - 1.0)
+LOG_SAMPLE_RATE: float = float(os.getenv("LOG_SAMPLE_RATE", "1.0"))
+
+
+def _trace_id(traceparent: str | None) -> str | None:
+    # W3C traceparent: "<version>-<32 hex trace-id>-<16 hex parent-id>-<flags>"
+    if traceparent:
+        parts = traceparent.split("-")
+        if len(parts) == 4 and len(parts[1]) == 32:
+            return parts[1]
+    return None
+
+
+class CorrelationIdMiddleware:
+    # Plain ASGI middleware: unlike BaseHTTPMiddleware it does not spawn an extra
+    # task and memory stream per request just to read and set one header
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Use existing ID from header (if any), then the W3C trace id, otherwise generate new
+        headers = Headers(scope=scope)
+        corr_id = (
+            headers.get("X-Request-ID")
+            or _trace_id(headers.get("traceparent"))
+            or secrets.token_hex(16)
+        )
+        sampled = random.random() < LOG_SAMPLE_RATE or "x-force-trace" in headers
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Return the ID in response headers for easier debugging
+                MutableHeaders(scope=message)["X-Request-ID"] = corr_id
+            await send(message)
+
         # Set the context variable
-        token = request_id_ctx.set(corr_id)
-        
-        response = await call_next(request)
-        
-        # Return the ID in response headers for easier debugging
-        response.headers["X-Request-ID"] = corr_id
-        
-        request_id_ctx.reset(token)
-        return response
\ No newline at end of file
+        token = request_ctx.set(ReqCtx(corr_id, sampled))
+
+        # Not reset if the app raises, so the outer error middleware still logs
+        # with this ID (each request runs in its own context anyway)
+        await self.app(scope, receive, send_with_request_id)
+
+        request_ctx.reset(token)
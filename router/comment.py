@@ -6,14 +6,16 @@ from schemas.schemas_comment import (
 )
 from schemas.schemas_paginated_comment import PaginatedCommentDisplay
 from sqlalchemy.ext.asyncio.session import AsyncSession
-from fastapi import APIRouter, HTTPException, Depends, Path, status
+from fastapi.responses import ORJSONResponse
+from fastapi import APIRouter, Depends, Header, Path, Query, Response, status
 from auth.oauth2 import get_current_user_id
 from db.database import get_async_db
 from typing import Annotated
-from sqlalchemy import text
-from pydantic import Field
 from db import db_comment
+import hashlib
 
+# Routes return db_comment's dicts in an ORJSONResponse as is, so response_model
+# only documents the response shape in OpenAPI and is never used to serialize
 router = APIRouter(tags=["comment"])
 
 CommentIdPath = Annotated[
@@ -25,32 +27,31 @@ CommentIdPath = Annotated[
     ),
 ]
 
-CurrentUser = Annotated[
+LimitQuery = Annotated[
     int,
-    Field(
-        description="The unique ID of the user",
-        gt=0,
-        json_schema_extra={"example": 1},
+    Query(
+        description="Page size",
+        ge=1,
+        le=100,
+        json_schema_extra={"example": 10},
     ),
 ]
 
+# ID of the authenticated user, resolved from the bearer token
+CurrentUser = Annotated[int, Depends(get_current_user_id)]
 
-# --------------------------------------------------------------------------
+# Lets clients and proxies reuse a page for a few seconds while scrolling
+READ_ALL_CACHE_CONTROL = "private, max-age=5"
 
 
-@router.get("/health", tags=["system"])
-async def health_check(db: AsyncSession = Depends(get_async_db)):
-    try:
-        # Execute a trivial query to confirm DB connectivity
-        await db.execute(text("SELECT 1"))
-        return {"status": "healthy", "database": "connected"}
-    except Exception as e:
-        print(f"HEALTH CHECK FAILURE: {e}")
-        # If the DB is down, return a 503 so K8s knows the pod is failing
-        raise HTTPException(
-            status_code=503, 
-            detail=f"Database connection failed: {str(e)}"
-        )
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    # If-None-Match uses the weak comparison (RFC 9110): a proxy that weakened
+    # the ETag to W/"..." still gets a 304, and "*" matches any current page
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
 
 
 # --------------------------------------------------------------------------
@@ -61,14 +62,16 @@ async def health_check(db: AsyncSession = Depends(get_async_db)):
     summary="une phrase qui resume la fonction.",
     description="une decription longue et precise",
     status_code=status.HTTP_201_CREATED,
+    response_model=CommentDisplay,
+    response_class=ORJSONResponse,
 )
 async def create(
     request: CommentModel,
+    current_user_id: CurrentUser,
     db: AsyncSession = Depends(get_async_db),
-    current_user_id: CurrentUser = Depends(get_current_user_id),
-) -> CommentDisplay:
-    comment: CommentDisplay = await db_comment.create(request, db, current_user_id)
-    return comment
+) -> ORJSONResponse:
+    comment = await db_comment.create(request, db, current_user_id)
+    return ORJSONResponse(comment, status_code=status.HTTP_201_CREATED)
 
 
 # --------------------------------------------------------------------------
@@ -78,14 +81,25 @@ async def create(
     "/read_all",
     summary="Retrieve all comments",
     description="Returns a complete list of all comments stored in the PostgreSQL database.",
+    response_model=PaginatedCommentDisplay,
+    response_class=ORJSONResponse,
 )
 async def read_all(
-    limit: int = 10,
+    limit: LimitQuery = 10,
     last_id: int | None = None,
+    if_none_match: Annotated[str | None, Header()] = None,
     db: AsyncSession = Depends(get_async_db),
-) -> PaginatedCommentDisplay:
-    comment: PaginatedCommentDisplay = await db_comment.read_all(limit, last_id, db)
-    return comment
+) -> Response:
+    comment = await db_comment.read_all(limit, last_id, db)
+    response = ORJSONResponse(comment)
+
+    etag = f'"{hashlib.blake2b(response.body, digest_size=8).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": READ_ALL_CACHE_CONTROL}
+    if if_none_match and _etag_matches(if_none_match, etag):
+        # The client already has this exact page, skip sending the body
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return response
 
 
 # --------------------------------------------------------------------------
@@ -95,17 +109,17 @@ async def read_all(
     "/update/{comment_id}",
     summary="Update an existing comment",
     description="Perform a full update of a comment's information. All fields in the request body are required.",
+    response_model=CommentDisplay,
+    response_class=ORJSONResponse,
 )
 async def update(
     comment_id: CommentIdPath,
     request: CommentUpdateModel,
+    current_user_id: CurrentUser,
     db: AsyncSession = Depends(get_async_db),
-    current_user_id: CurrentUser = Depends(get_current_user_id),
-) -> CommentDisplay:
-    comment: CommentDisplay = await db_comment.update(
-        comment_id, request, db, current_user_id
-    )
-    return comment
+) -> ORJSONResponse:
+    comment = await db_comment.update(comment_id, request, db, current_user_id)
+    return ORJSONResponse(comment)
 
 
 # --------------------------------------------------------------------------
@@ -115,17 +129,17 @@ async def update(
     "/patch/{comment_id}",
     summary="Partially update a comment",
     description="Update specific fields of a comment record without affecting the others.",
+    response_model=CommentDisplay,
+    response_class=ORJSONResponse,
 )
 async def patch(
     comment_id: CommentIdPath,
     request: CommentPatchModel,
+    current_user_id: CurrentUser,
     db: AsyncSession = Depends(get_async_db),
-    current_user_id: CurrentUser = Depends(get_current_user_id),
-) -> CommentDisplay:
-    comment: CommentDisplay = await db_comment.patch(
-        comment_id, request, db, current_user_id
-    )
-    return comment
+) -> ORJSONResponse:
+    comment = await db_comment.patch(comment_id, request, db, current_user_id)
+    return ORJSONResponse(comment)
 
 
 # --------------------------------------------------------------------------
@@ -136,11 +150,12 @@ async def patch(
     summary="Delete a comment from the database",
     description="Permanently removes a comment record from the PostgreSQL database using their unique ID.",
     status_code=status.HTTP_204_NO_CONTENT,
+    response_class=Response,
 )
 async def delete(
     comment_id: CommentIdPath,
+    current_user_id: CurrentUser,
     db: AsyncSession = Depends(get_async_db),
-    current_user_id: CurrentUser = Depends(get_current_user_id),
-) -> None:
+) -> Response:
     await db_comment.delete(comment_id, db, current_user_id)
-    return None
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
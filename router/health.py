@@ -0,0 +1,38 @@
+from fastapi import APIRouter, HTTPException, Request, status
+from sqlalchemy import text
+import asyncio
+import logging
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+router = APIRouter(tags=["system"])
+
+# A hung database must not keep readiness probes waiting
+HEALTH_CHECK_TIMEOUT = 1.0
+
+
+# --------------------------------------------------------------------------
+
+
+@router.get("/health/live")
+async def liveness_check():
+    # Never touches the database, so K8s only restarts the pod if the process is stuck
+    return {"status": "ok"}
+
+
+@router.get("/health")
+@router.get("/health/ready")
+async def health_check(request: Request):
+    try:
+        # Execute a trivial query on the dedicated health check engine, outside the request pool
+        async with asyncio.timeout(HEALTH_CHECK_TIMEOUT):
+            async with request.app.state.admin_engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+        return {"status": "healthy", "database": "connected"}
+    except Exception:
+        logger.exception("health check failed")
+        # If the DB is down, return a 503 so K8s knows the pod is failing
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Database connection failed",
+        )
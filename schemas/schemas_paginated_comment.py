@@ -1,5 +1,4 @@
-from pydantic import BaseModel, ConfigDict, field_serializer
-from datetime import datetime
+from pydantic import BaseModel
 from typing import List
 
 class Comments(BaseModel):
@@ -7,18 +6,10 @@ class Comments(BaseModel):
     user_id: int
     post_id: int
     text: str
-    timestamp: datetime
-
-    model_config = ConfigDict(from_attributes=True)
-
-    @field_serializer('timestamp')
-    def format_timestamp(self, dt: datetime) -> str:
-        # .strftime converts the datetime object to your specific string format
-        return dt.strftime('%Y-%m-%dT%H:%M')
+    # 'YYYY-MM-DDTHH:MM' (UTC), already formatted by the database
+    timestamp: str
 
 class PaginatedCommentDisplay(BaseModel):
     items: List[Comments]
     next_cursor: int | None
     has_more: bool
-
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
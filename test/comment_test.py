@@ -0,0 +1,133 @@
+from datetime import datetime
+from httpx import AsyncClient
+from auth.oauth2 import get_current_user_id
+from main import app
+import pytest
+
+
+@pytest.fixture
+def current_user():
+    """Authenticates every request as user 1."""
+    app.dependency_overrides[get_current_user_id] = lambda: 1
+    yield 1
+    app.dependency_overrides.pop(get_current_user_id, None)
+
+
+@pytest.mark.asyncio
+async def test_create_comment(client: AsyncClient, current_user: int):
+    response = await client.post("/create", json={"post_id": 7, "text": "hello"})
+    assert response.status_code == 201
+    body = response.json()
+    assert body["id"] > 0
+    assert body["user_id"] == current_user
+    assert body["post_id"] == 7
+    assert body["text"] == "hello"
+    assert isinstance(body["timestamp"], str)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("post_id", [0, -1])
+async def test_create_rejects_non_positive_post_id(client: AsyncClient, current_user: int, post_id: int):
+    response = await client.post("/create", json={"post_id": post_id, "text": "hello"})
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_read_all_pages_through_comments(client: AsyncClient, current_user: int):
+    for i in range(3):
+        response = await client.post("/create", json={"post_id": 8, "text": f"page {i}"})
+        assert response.status_code == 201
+
+    response = await client.get("/read_all", params={"limit": 2})
+    assert response.status_code == 200
+    first_page = response.json()
+    assert len(first_page["items"]) == 2
+    assert first_page["has_more"] is True
+    assert first_page["next_cursor"] == first_page["items"][-1]["id"]
+
+    response = await client.get(
+        "/read_all", params={"limit": 2, "last_id": first_page["next_cursor"]}
+    )
+    assert response.status_code == 200
+    second_page = response.json()
+    assert second_page["items"]
+    assert all(c["id"] < first_page["next_cursor"] for c in second_page["items"])
+
+
+@pytest.mark.asyncio
+async def test_read_all_cursor_zero_is_past_the_last_page(client: AsyncClient):
+    response = await client.get("/read_all", params={"last_id": 0})
+    assert response.status_code == 200
+    assert response.json() == {"items": [], "next_cursor": None, "has_more": False}
+
+
+@pytest.mark.asyncio
+async def test_update_patch_and_delete_comment(client: AsyncClient, current_user: int):
+    response = await client.post("/create", json={"post_id": 9, "text": "draft"})
+    comment_id = response.json()["id"]
+
+    response = await client.put(f"/update/{comment_id}", json={"text": "edited"})
+    assert response.status_code == 200
+    assert response.json()["text"] == "edited"
+
+    response = await client.patch(f"/patch/{comment_id}", json={"text": "patched"})
+    assert response.status_code == 200
+    assert response.json()["text"] == "patched"
+    assert response.json()["post_id"] == 9
+
+    response = await client.delete(f"/delete/{comment_id}")
+    assert response.status_code == 204
+    assert response.content == b""
+
+    response = await client.patch(f"/patch/{comment_id}", json={"text": "gone"})
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_patch_without_fields_is_rejected(client: AsyncClient, current_user: int):
+    response = await client.patch("/patch/1", json={})
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_delete_unknown_comment_is_rejected(client: AsyncClient, current_user: int):
+    response = await client.delete("/delete/999999")
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_read_all_formats_timestamps_to_the_minute(client: AsyncClient, current_user: int):
+    await client.post("/create", json={"post_id": 10, "text": "timestamped"})
+    response = await client.get("/read_all", params={"limit": 1})
+    timestamp = response.json()["items"][0]["timestamp"]
+    assert datetime.strptime(timestamp, "%Y-%m-%dT%H:%M")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("limit", [0, 101])
+async def test_read_all_rejects_out_of_range_limit(client: AsyncClient, limit: int):
+    response = await client.get("/read_all", params={"limit": limit})
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_read_all_answers_304_for_a_matching_etag(client: AsyncClient):
+    response = await client.get("/read_all")
+    etag = response.headers["ETag"]
+    assert response.headers["Cache-Control"] == "private, max-age=5"
+
+    response = await client.get("/read_all", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+@pytest.mark.asyncio
+async def test_read_all_compares_etags_weakly(client: AsyncClient):
+    etag = (await client.get("/read_all")).headers["ETag"]
+
+    for if_none_match in (f'"stale", W/{etag}', "*"):
+        response = await client.get("/read_all", headers={"If-None-Match": if_none_match})
+        assert response.status_code == 304
+
+    response = await client.get("/read_all", headers={"If-None-Match": '"stale"'})
+    assert response.status_code == 200
@@ -0,0 +1,20 @@
+from httpx import AsyncClient
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_request_id_header_is_echoed(client: AsyncClient):
+    response = await client.get("/read_all", headers={"X-Request-ID": "abc-123"})
+    assert response.headers["X-Request-ID"] == "abc-123"
+
+
+@pytest.mark.asyncio
+async def test_request_id_falls_back_to_traceparent_then_random(client: AsyncClient):
+    trace_id = "4bf92f3577b34da6a3ce929d0e0e4736"
+    response = await client.get(
+        "/read_all", headers={"traceparent": f"00-{trace_id}-00f067aa0ba902b7-01"}
+    )
+    assert response.headers["X-Request-ID"] == trace_id
+
+    response = await client.get("/read_all")
+    assert len(response.headers["X-Request-ID"]) == 32
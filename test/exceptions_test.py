@@ -0,0 +1,67 @@
+from sqlalchemy.exc import (
+    IntegrityError,
+    NoReferencedTableError,
+    NoResultFound,
+    OperationalError,
+    ProgrammingError,
+    SQLAlchemyError,
+)
+from httpx import AsyncClient, ASGITransport
+from fastapi import FastAPI
+from exc.exceptions import add_exception_handlers, find_error_spec
+import logging
+import orjson
+import pytest
+
+
+class _UndefinedTable(Exception):
+    sqlstate = "42P01"
+
+
+@pytest.mark.parametrize(
+    ("exc", "status_code"),
+    [
+        (IntegrityError("INSERT", {}, Exception()), 409),
+        (OperationalError("SELECT 1", {}, Exception()), 503),
+        (NoResultFound(), 404),
+        (NoReferencedTableError("missing", "post"), 500),
+        (SQLAlchemyError(), 500),
+        (ValueError(), 500),
+    ],
+)
+def test_find_error_spec_uses_closest_class(exc: Exception, status_code: int):
+    assert find_error_spec(exc).status_code == status_code
+
+
+def test_find_error_spec_maps_undefined_table_sqlstate():
+    exc = ProgrammingError("SELECT * FROM comment", {}, _UndefinedTable())
+    assert "solution" in find_error_spec(exc).content
+
+
+@pytest.mark.asyncio
+async def test_handler_logs_label_and_returns_spec_body(caplog: pytest.LogCaptureFixture):
+    app = FastAPI()
+    add_exception_handlers(app)
+
+    @app.get("/conflict")
+    async def conflict():
+        raise IntegrityError("INSERT", {}, Exception())
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        with caplog.at_level(logging.ERROR, logger="exc.exceptions"):
+            response = await ac.get("/conflict")
+    assert response.status_code == 409
+    assert caplog.records[-1].getMessage().startswith("Database Integrity Error")
+    assert response.json() == {
+        "detail": "Data conflict: (likely email or username) already exists.",
+        "hint": "No hint found",
+    }
+
+
+def test_error_spec_body_is_prebuilt_unless_the_exception_has_a_hint():
+    spec = find_error_spec(IntegrityError("INSERT", {}, Exception()))
+    assert spec.render(IntegrityError("INSERT", {}, Exception())) is spec.body
+
+    exc = IntegrityError("INSERT", {}, Exception())
+    exc.hint = "post_id must reference an existing post"  # type: ignore[attr-defined]
+    assert orjson.loads(spec.render(exc))["hint"] == exc.hint
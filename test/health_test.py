@@ -0,0 +1,27 @@
+from httpx import AsyncClient
+from db.database import build_admin_engine
+from main import app
+import pytest
+
+
+@pytest.fixture
+async def admin_engine():
+    """Provides the health check engine the lifespan would normally build."""
+    app.state.admin_engine = build_admin_engine()
+    yield app.state.admin_engine
+    await app.state.admin_engine.dispose()
+    del app.state.admin_engine
+
+
+@pytest.mark.asyncio
+async def test_liveness_does_not_need_the_database(client: AsyncClient):
+    response = await client.get("/health/live")
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+
+
+@pytest.mark.asyncio
+async def test_readiness_uses_the_admin_engine(client: AsyncClient, admin_engine):
+    response = await client.get("/health/ready")
+    assert response.status_code == 200
+    assert response.json() == {"status": "healthy", "database": "connected"}
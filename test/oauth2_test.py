@@ -0,0 +1,45 @@
+from httpx import AsyncClient
+from jose import jwt
+from auth import oauth2
+import time
+import pytest
+
+
+@pytest.fixture
+def secret(monkeypatch: pytest.MonkeyPatch):
+    """Configures the JWT settings and starts from an empty decode cache."""
+    monkeypatch.setattr(oauth2, "SECRET_KEY", "test-secret")
+    monkeypatch.setattr(oauth2, "ALGORITHM", "HS256")
+    oauth2._decode.cache_clear()
+    yield "test-secret"
+    oauth2._decode.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_token_is_decoded_once_per_token(client: AsyncClient, secret: str):
+    token = jwt.encode({"sub": "5", "exp": time.time() + 60}, secret, algorithm="HS256")
+    headers = {"Authorization": f"Bearer {token}"}
+    for _ in range(2):
+        response = await client.post("/create", json={"post_id": 1, "text": "hi"}, headers=headers)
+        assert response.status_code == 201
+        assert response.json()["user_id"] == 5
+    assert oauth2._decode.cache_info().hits == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_token_is_rejected_once_expired(
+    client: AsyncClient, secret: str, monkeypatch: pytest.MonkeyPatch
+):
+    exp = time.time() + 60
+    token = jwt.encode({"sub": "5", "exp": exp}, secret, algorithm="HS256")
+    assert await oauth2.get_current_user_id(token) == 5
+
+    monkeypatch.setattr(oauth2, "_now", lambda: exp + 1)
+    response = await client.delete("/delete/1", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_invalid_token_is_rejected(client: AsyncClient, secret: str):
+    response = await client.delete("/delete/1", headers={"Authorization": "Bearer not-a-jwt"})
+    assert response.status_code == 401